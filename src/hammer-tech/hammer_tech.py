@@ -369,7 +369,7 @@ class HammerTechnology:
             return None
         else:
             # Work around the weird objects implemented by the jsonschema generator.
-            dont_use_list = list(map(lambda x: str(x), list(dont_use_list_raw)))
+            dont_use_list = list(map(str, dont_use_list_raw))
             return dont_use_list
 
     @property
@@ -617,8 +617,7 @@ class HammerTechnology:
         extra IP libraries specified in the config (see get_extra_libraries).
         :return: List of all available IP libraries.
         """
-        return list(self.tech_defined_libraries) + list(
-            map(lambda el: el.store_into_library(), self.get_extra_libraries()))
+        return list(self.tech_defined_libraries) + [el.store_into_library() for el in self.get_extra_libraries()]
 
     def process_library_filter(self,
                                filt: LibraryFilter,
@@ -7,7 +7,7 @@
 
 from typing import Dict, Tuple, List, Optional, Union
 
-from hammer_vlsi import DelayConstraint
+from hammer_vlsi import DelayConstraint, ObstructionType, PlacementConstraintType
 from hammer_vlsi.units import TimeValue
 
 import unittest
@@ -83,5 +83,27 @@ class DelayConstraintTest(unittest.TestCase):
             })
 
 
+class ConstraintTypeStrTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        """
+        Test that every obstruction/placement constraint type converts to and from str.
+        """
+        for obs_type in ObstructionType:
+            self.assertEqual(ObstructionType.from_str(str(obs_type)), obs_type)
+        for constraint_type in PlacementConstraintType:
+            self.assertEqual(PlacementConstraintType.from_str(str(constraint_type)), constraint_type)
+        self.assertEqual(str(ObstructionType.Route), "route")
+        self.assertEqual(str(PlacementConstraintType.HardMacro), "hardmacro")
+
+    def test_invalid_str(self) -> None:
+        """
+        Test that invalid strings raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            ObstructionType.from_str("Route")
+        with self.assertRaises(ValueError):
+            PlacementConstraintType.from_str("")
+
+
 if __name__ == '__main__':
      unittest.main()
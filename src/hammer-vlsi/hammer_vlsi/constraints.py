@@ -102,23 +102,24 @@ class ObstructionType(Enum):
     Route = 2
     Power = 3
 
-    @classmethod
-    def __mapping(cls) -> Dict[str, "ObstructionType"]:
-        return {
-            "place": ObstructionType.Place,
-            "route": ObstructionType.Route,
-            "power": ObstructionType.Power
-        }
-
     @staticmethod
     def from_str(input_str: str) -> "ObstructionType":
         try:
-            return ObstructionType.__mapping()[input_str]
+            return _OBSTRUCTION_TYPE_FROM_STR[input_str]
         except KeyError:
             raise ValueError("Invalid obstruction type: " + str(input_str))
 
     def __str__(self) -> str:
-        return reverse_dict(ObstructionType.__mapping())[self]
+        return _OBSTRUCTION_TYPE_TO_STR[self]
+
+
+# Built once at import time so that from_str/__str__ are plain dict lookups.
+_OBSTRUCTION_TYPE_FROM_STR = {
+    "place": ObstructionType.Place,
+    "route": ObstructionType.Route,
+    "power": ObstructionType.Power
+}  # type: Dict[str, ObstructionType]
+_OBSTRUCTION_TYPE_TO_STR = reverse_dict(_OBSTRUCTION_TYPE_FROM_STR)  # type: Dict[ObstructionType, str]
 
 
 class PlacementConstraintType(Enum):
@@ -129,26 +130,27 @@ class PlacementConstraintType(Enum):
     Hierarchical = 5
     Obstruction = 6
 
-    @classmethod
-    def __mapping(cls) -> Dict[str, "PlacementConstraintType"]:
-        return {
-            "dummy": PlacementConstraintType.Dummy,
-            "placement": PlacementConstraintType.Placement,
-            "toplevel": PlacementConstraintType.TopLevel,
-            "hardmacro": PlacementConstraintType.HardMacro,
-            "hierarchical": PlacementConstraintType.Hierarchical,
-            "obstruction": PlacementConstraintType.Obstruction
-        }
-
     @staticmethod
     def from_str(input_str: str) -> "PlacementConstraintType":
         try:
-            return PlacementConstraintType.__mapping()[input_str]
+            return _PLACEMENT_CONSTRAINT_TYPE_FROM_STR[input_str]
         except KeyError:
             raise ValueError("Invalid placement constraint type: " + str(input_str))
 
     def __str__(self) -> str:
-        return reverse_dict(PlacementConstraintType.__mapping())[self]
+        return _PLACEMENT_CONSTRAINT_TYPE_TO_STR[self]
+
+
+_PLACEMENT_CONSTRAINT_TYPE_FROM_STR = {
+    "dummy": PlacementConstraintType.Dummy,
+    "placement": PlacementConstraintType.Placement,
+    "toplevel": PlacementConstraintType.TopLevel,
+    "hardmacro": PlacementConstraintType.HardMacro,
+    "hierarchical": PlacementConstraintType.Hierarchical,
+    "obstruction": PlacementConstraintType.Obstruction
+}  # type: Dict[str, PlacementConstraintType]
+_PLACEMENT_CONSTRAINT_TYPE_TO_STR = reverse_dict(
+    _PLACEMENT_CONSTRAINT_TYPE_FROM_STR)  # type: Dict[PlacementConstraintType, str]
 
 
 # For the top-level chip size constraint, set the margin from core area to left/bottom/right/top.
@@ -246,16 +248,19 @@ class MMMCCornerType(Enum):
 
     @staticmethod
     def from_string(input_str: str) -> "MMMCCornerType":
-        if input_str == "setup":  # pylint: disable=no-else-return
-            return MMMCCornerType.Setup
-        elif input_str == "hold":
-            return MMMCCornerType.Hold
-        elif input_str == "extra":
-            return MMMCCornerType.Extra
-        else:
+        try:
+            return _MMMC_CORNER_TYPE_FROM_STR[input_str]
+        except KeyError:
             raise ValueError("Invalid MMMC corner type '{}'".format(input_str))
 
 
+_MMMC_CORNER_TYPE_FROM_STR = {
+    "setup": MMMCCornerType.Setup,
+    "hold": MMMCCornerType.Hold,
+    "extra": MMMCCornerType.Extra
+}  # type: Dict[str, MMMCCornerType]
+
+
 MMMCCorner = NamedTuple('MMMCCorner', [
     ('name', str),
     ('type', MMMCCornerType),
@@ -520,7 +520,7 @@ class HammerTool(metaclass=ABCMeta):
         :param funcs: List of bound methods (e.g. [self.step1, self.step2])
         :return: List of HammerToolSteps
         """
-        return list(map(lambda x: HammerTool.make_step_from_method(x), funcs))
+        return list(map(HammerTool.make_step_from_method, funcs))
 
     @staticmethod
     def make_step_from_function(func: HammerStepFunction, name: str = "") -> HammerToolStep:
@@ -693,7 +693,7 @@ class HammerTool(metaclass=ABCMeta):
 
     def get_config(self) -> List[dict]:
         """Get the config for this tool."""
-        return reduce(add_lists, map(lambda path: hammer_config.load_config_from_defaults(path), self.config_dirs))
+        return reduce(add_lists, map(hammer_config.load_config_from_defaults, self.config_dirs))
 
     def get_setting(self, key: str, nullvalue: Optional[str] = None) -> Any:
         """
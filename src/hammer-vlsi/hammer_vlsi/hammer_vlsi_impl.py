@@ -27,31 +27,34 @@ class HierarchicalMode(Enum):
     Hierarchical = 3
     Top = 4
 
-    @classmethod
-    def __mapping(cls) -> Dict[str, "HierarchicalMode"]:
-        return {
-            "flat": HierarchicalMode.Flat,
-            "leaf": HierarchicalMode.Leaf,
-            "hierarchical": HierarchicalMode.Hierarchical,
-            "top": HierarchicalMode.Top
-        }
-
     @staticmethod
     def from_str(x: str) -> "HierarchicalMode":
         try:
-            return HierarchicalMode.__mapping()[x]
+            return _HIERARCHICAL_MODE_FROM_STR[x]
         except KeyError:
             raise ValueError("Invalid string for HierarchicalMode: " + str(x))
 
     def __str__(self) -> str:
-        return reverse_dict(HierarchicalMode.__mapping())[self]
+        return _HIERARCHICAL_MODE_TO_STR[self]
 
     def is_nonleaf_hierarchical(self) -> bool:
         """
         Helper function that returns True if this mode is a non-leaf hierarchical mode (i.e. any block with
         hierarchical sub-blocks).
         """
-        return self == HierarchicalMode.Hierarchical or self == HierarchicalMode.Top
+        return self in _NONLEAF_HIERARCHICAL_MODES
+
+
+# Built once at import time so that from_str/__str__ are plain dict lookups.
+_HIERARCHICAL_MODE_FROM_STR = {
+    "flat": HierarchicalMode.Flat,
+    "leaf": HierarchicalMode.Leaf,
+    "hierarchical": HierarchicalMode.Hierarchical,
+    "top": HierarchicalMode.Top
+}  # type: Dict[str, HierarchicalMode]
+_HIERARCHICAL_MODE_TO_STR = reverse_dict(_HIERARCHICAL_MODE_FROM_STR)  # type: Dict[HierarchicalMode, str]
+_NONLEAF_HIERARCHICAL_MODES = frozenset([HierarchicalMode.Hierarchical, HierarchicalMode.Top])
+
 
 class HammerToolPauseException(Exception):
     """